@@ -8,6 +8,7 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import logging
 import os
 import shutil
 import sys
@@ -370,6 +371,10 @@ class BaseRig():
         _arc_date = datetime.strftime(datetime.now(), '%Y-%m-%d-%H%M%S')
         _arc_name = "rig-%s-%s" % (self.name, _arc_date)
         _arc_fname = "/var/tmp/%s.tar.gz" % _arc_name
+        # log records are written to the rig's private log in tmpdir from a
+        # background thread, so make sure they have all landed before archiving
+        for _handler in self.logger.logger.handlers:
+            _handler.flush()
         with tarfile.open(_arc_fname, 'w:gz') as tar:
             tar.add(self.tmpdir, arcname=_arc_name)
         return _arc_fname
@@ -399,6 +404,8 @@ class BaseRig():
                 shutil.rmtree(self.tmpdir)
             except Exception as err:
                 self.logger.error(f"Could not remove temp directory: {err}")
+            # os._exit() skips atexit, so flush queued log records first
+            logging.shutdown()
             os._exit(0)
 
     def _destroy_self(self):
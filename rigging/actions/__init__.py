@@ -8,17 +8,23 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import functools
 import os
 import shlex
 import shutil
+import signal
 import time
 
-from subprocess import Popen, PIPE
+from collections import deque
+from subprocess import Popen, PIPE, DEVNULL, TimeoutExpired
+from threading import Event, Timer
 
 
+@functools.lru_cache(maxsize=None)
 def check_exists(binary):
     """
-    Checks to see if the given binary exists in PATH.
+    Checks to see if the given binary exists in PATH. Results are cached, as
+    the same binaries are often checked for by several actions.
 
     :param binary: The binary/command to verify existence of
     """
@@ -168,13 +174,58 @@ class BaseAction():
         rc = proc.returncode
         return {'status': rc, 'stdout': stdout, 'stderr': stderr}
 
+    def exec_cmd_tail(self, cmd, tail=2, timeout=180):
+        """
+        Executes the given command similarly to `exec_cmd()`, but reads stdout
+        as it is produced and only retains the last `tail` lines of it, rather
+        than buffering the entire output. stderr is discarded.
+
+        The command is run in its own session, so that if it times out any
+        children it spawned (e.g. gdb from gcore) are killed along with it.
+
+        :param cmd: The command to execute as a string
+        :param tail: The number of trailing lines of stdout to keep
+        :param timeout: The amount of time in seconds to allow cmd to run
+
+        :return: dict of {status, stdout_tail}
+        :raises: subprocess.TimeoutExpired if cmd does not finish in time
+        """
+        self.logger.debug(f"Running command {cmd}")
+        cmd = shlex.split(cmd)
+        proc = Popen(cmd, stdout=PIPE, stderr=DEVNULL, encoding='utf-8',
+                     shell=False, start_new_session=True)
+        timed_out = Event()
+
+        def _kill_session():
+            timed_out.set()
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+        _timer = Timer(timeout, _kill_session)
+        _timer.start()
+        try:
+            _tail = deque(proc.stdout, maxlen=tail)
+            rc = proc.wait()
+        finally:
+            _timer.cancel()
+            proc.stdout.close()
+        if timed_out.is_set():
+            raise TimeoutExpired(cmd, timeout)
+        return {'status': rc, 'stdout_tail': list(_tail)}
+
     def add_archive_file(self, filename):
         """
-        Add a file to the archive that will be generated at the conclusion of
-        this rig.
+        Add a file, or list of files, to the archive that will be generated at
+        the conclusion of this rig.
 
-        :param filename: The absolute filename of the file to add
+        :param filename: The absolute filename of the file to add, or a list
+                         of absolute filenames
         """
+        if isinstance(filename, list):
+            _ret = [self.add_archive_file(_fname) for _fname in filename]
+            return False if False in _ret else None
         if not filename.startswith(self.tmpdir):
             try:
                 shutil.move(filename, self.tmpdir)
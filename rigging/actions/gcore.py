@@ -8,7 +8,8 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
-import psutil
+import itertools
+import logging
 import signal
 import os
 
@@ -65,14 +66,12 @@ class GcoreAction(BaseAction):
                 f"No PIDs found matching procs '{', '.join(p for p in procs)}'"
             )
 
-        _pids = []
-        for _procs in self.procs.values():
-            _pids.extend(_procs)
-
-        self.logger.debug(
-            f"PID list for generating core dumps determined to be: "
-            f"{', '.join(str(p) for p in _pids)}"
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            _pids = itertools.chain.from_iterable(self.procs.values())
+            self.logger.debug(
+                f"PID list for generating core dumps determined to be: "
+                f"{', '.join(map(str, _pids))}"
+            )
         self.freeze = freeze
 
     def freeze_pid(self, pid):
@@ -100,9 +99,11 @@ class GcoreAction(BaseAction):
         return False
 
     def trigger(self):
+        # read /proc once, instead of checking for each pid individually
+        live = {int(e.name) for e in os.scandir('/proc') if e.name.isdigit()}
         for proc in self.procs:
             for pid in self.procs[proc]:
-                if not psutil.pid_exists(int(pid)):
+                if int(pid) not in live:
                     self.logger.error(
                         f"Cannot collect coredump for pid {pid} - process no "
                         f"longer exists"
@@ -137,7 +138,13 @@ class GcoreAction(BaseAction):
             _frozen = self.freeze_pid(pid)
 
         self.logger.debug(f"Collecting coredump of {pid} at {fname}")
-        ret = self.exec_cmd(f"gcore -o {filename} {pid}")
+        try:
+            ret = self.exec_cmd_tail(f"gcore -o {filename} {pid}")
+        except Exception:
+            # e.g. gcore timed out, don't leave the process stopped
+            if _frozen:
+                self.thaw_pid(pid)
+            raise
         if ret['status'] == 0:
             if os.path.isfile(fname):
                 self.add_archive_file(fname)
@@ -146,7 +153,7 @@ class GcoreAction(BaseAction):
                     "Coredump not generated at expected location, attempting "
                     "to determine core filename"
                 )
-                _fname = ret['stdout'].splitlines()[-2].split()[-1]
+                _fname = ret['stdout_tail'][-2].split()[-1]
                 if os.path.isfile(_fname):
                     self.logger.info(
                         f"Coredump {_fname} found. Adding to archive"
@@ -162,7 +169,9 @@ class GcoreAction(BaseAction):
                 "Error collecting coredump via gcore. See debug logs "
                 "for details"
             )
-            self.logger.debug(f"gcore output: {ret['stdout']}")
+            self.logger.debug(
+                f"gcore output ended with: {''.join(ret['stdout_tail'])}"
+            )
 
         if _frozen:
             self.thaw_pid(pid)
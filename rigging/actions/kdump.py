@@ -8,6 +8,8 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import os
+
 from rigging.actions import BaseAction
 
 
@@ -56,14 +58,16 @@ class KdumpAction(BaseAction):
     def pre_action(self):
         if self.sysrq is not None:
             self.logger.info(f"Setting /proc/sys/kernel/sysrq to {self.sysrq}")
-            with open('/proc/sys/kernel/sysrq', 'w') as kern_sysrq:
-                try:
-                    kern_sysrq.write(self.sysrq)
-                except Exception as err:
-                    self.logger.error(
-                        f"Failed to set /proc/sys/kernel/sysrq: {err}"
-                    )
+            fd = os.open('/proc/sys/kernel/sysrq', os.O_WRONLY)
+            try:
+                os.write(fd, str(self.sysrq).encode())
+            except Exception as err:
+                self.logger.error(
+                    f"Failed to set /proc/sys/kernel/sysrq: {err}"
+                )
                 return False
+            finally:
+                os.close(fd)
         return True
 
     def trigger(self):
@@ -71,8 +75,13 @@ class KdumpAction(BaseAction):
             'Writing \'c\' to /proc/sysrq-trigger - look in your '
             'configured crash location for a vmcore after reboot'
         )
-        with open('/proc/sysrq-trigger', 'w') as sysrq:
-            sysrq.write('c')
+        # write directly to the fd so that the request reaches the kernel
+        # immediately, rather than sitting in a python buffer until close
+        fd = os.open('/proc/sysrq-trigger', os.O_WRONLY)
+        try:
+            os.write(fd, b'c')
+        finally:
+            os.close(fd)
 
     @property
     def produces(self):
@@ -8,10 +8,81 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
-import fnmatch
+import itertools
+import re
+import sys
 
 from rigging.actions import BaseAction
 
+# matches the final archive path printed by sos, e.g.
+# /var/tmp/sosreport-host-2023-01-01-abcdef.tar.xz
+SOS_TAR_RE = re.compile(r'sos.*-.*\.tar\.')
+
+# string values that enable a command without passing it any options
+ENABLED_VALUES = frozenset(('true', 'enabled', 'on'))
+
+# supported options and the type that any value given in the rigfile must be
+REPORT_OPTS = {
+    'case_id': str,
+    'clean': bool,
+    'only_plugins': list,
+    'skip_plugins': list,
+    'enable_plugins': list,
+    'plugin_option': dict,
+    'log_size': int,
+    'skip_commands': list,
+    'skip_files': list,
+    'verify': bool
+}
+
+COLLECT_OPTS = {
+    'primary': str,
+    'cluster_type': str,
+    'cluster_option': dict,
+    'nodes': list,
+    'no_local': bool,
+    'timeout': int,
+    'ssh_user': str,
+    'transport': str,
+}
+
+# the sos cmdline flag for each supported option
+CLI_FLAGS = {
+    k: sys.intern(f"--{k.replace('_', '-')}")
+    for k in [*REPORT_OPTS, *COLLECT_OPTS]
+}
+BATCH_FLAG = sys.intern('--batch')
+
+
+def format_opt(flag, val):
+    return f"{flag} {val}"
+
+
+# how an option is rendered on the sos cmdline, based on the type of its value.
+# Anything not listed here is passed through format_opt(). A disabled boolean
+# option is left off entirely.
+OPT_FORMATS = {
+    list: lambda flag, val: f"{flag} {','.join(val)}",
+    dict: lambda flag, val: (
+        f"{flag} {','.join(f'{k}={v}' for k, v in val.items())}"
+    ),
+    bool: lambda flag, val: flag if val else None,
+}
+
+
+def reversed_lines(text):
+    """
+    Yield the lines of a string from last to first, without first splitting
+    the entire string into a list.
+
+    :param text: The string to iterate over
+    """
+    end = len(text)
+    while end >= 0:
+        start = text.rfind('\n', 0, end)
+        yield text[start + 1:end]
+        end = start
+
 
 class SosAction(BaseAction):
     """
@@ -70,11 +141,13 @@ class SosAction(BaseAction):
             config = self._validate_config(collect, 'collect')
 
         self.sos_cmd = self._compile_sos_command(config)
+        if self.initial_archive:
+            self.initial_sos_cmd = f"{self.sos_cmd} --label initial"
 
     def trigger(self):
         self.logger.info(f"Collecting sos archive as '{self.sos_cmd}'")
         try:
-            if self.execute_sos_cmd():
+            if self.execute_sos_cmd(self.sos_cmd):
                 self.logger.info('sos archive successfully collected')
                 return True
             else:
@@ -84,27 +157,24 @@ class SosAction(BaseAction):
 
         return False
 
-    def execute_sos_cmd(self, label=None):
+    def execute_sos_cmd(self, sos_cmd):
         """
         Actually perform the sos command execution, then search for the output
         path and add that to the rig's archive.
 
-        :param label: Optionally, add a label to an archive run. If requested,
-                      the initial sos archive will always be labelled as such
+        :param sos_cmd: The sos command, as compiled during `configure()`, to
+                        execute
         """
-        _label = ''
-        if label:
-            _label = f" --label {label}"
         try:
-            ret = self.exec_cmd(self.sos_cmd + _label,
-                                timeout=self.timeout)
+            ret = self.exec_cmd(sos_cmd, timeout=self.timeout)
         except Exception as err:
             raise Exception(f"Error during sos execution: {err}")
 
         path = ''
         if ret['status'] == 0:
-            for line in ret['stdout'].splitlines():
-                if fnmatch.fnmatch(line, '*sos*-*.tar.*'):
+            # sos reports the archive path at the very end of its output
+            for line in itertools.islice(reversed_lines(ret['stdout']), 50):
+                if SOS_TAR_RE.search(line):
                     path = line.strip()
                     break
             if not path:
@@ -130,7 +200,7 @@ class SosAction(BaseAction):
                 'Generating initial sos archive, this may take some time'
             )
             try:
-                if self.execute_sos_cmd(label='initial'):
+                if self.execute_sos_cmd(self.initial_sos_cmd):
                     self.logger.info(
                         'Initial sos archive successfully collected'
                     )
@@ -152,24 +222,17 @@ class SosAction(BaseAction):
         rigfile
         :return: A string of the command being executed
         """
-        _cmd = f"sos {config.pop('command')} --batch"
+        _cmd = ['sos', config.pop('command'), BATCH_FLAG]
         if 'clean' in config:
             # allow extra time for obfuscation
             self.timeout += 180
 
         for k, v in config.items():
-            _val = v
-            if isinstance(_val, list):
-                _val = ','.join(e for e in _val)
-            elif isinstance(_val, bool):
-                if _val is True:
-                    _val = ''
-                else:
-                    continue
-            elif isinstance(_val, dict):
-                _val = ','.join(f"{k}={v}" for k, v in _val.items())
-            _cmd += f" --{k.replace('_', '-')} {_val}"
-        _cmd = _cmd.strip()
+            _fmt = OPT_FORMATS.get(type(v), format_opt)
+            _opt = _fmt(CLI_FLAGS[k], v)
+            if _opt:
+                _cmd.append(_opt)
+        _cmd = ' '.join(_cmd)
         self.logger.debug(f"sos command set to '{_cmd}'")
         return _cmd
 
@@ -184,7 +247,8 @@ class SosAction(BaseAction):
         if config is None:
             return config
 
-        if config in [True, 'true', 'enabled', 'on']:
+        if config is True or (isinstance(config, str) and
+                              config in ENABLED_VALUES):
             _cmd_config = {}
         else:
             _cmd_config = config
@@ -195,46 +259,22 @@ class SosAction(BaseAction):
                 f"Provide configuration options, or set '{cmd}' to enabled"
             )
 
-        _report_opts = {
-            'case_id': '',
-            'clean': False,
-            'only_plugins': [],
-            'skip_plugins': [],
-            'enable_plugins': [],
-            'plugin_option': {},
-            'log_size': 25,
-            'skip_commands': [],
-            'skip_files': [],
-            'verify': False
-        }
-
-        _collect_opts = {
-            'primary': '',
-            'cluster_type': '',
-            'cluster_option': {},
-            'nodes': [],
-            'no_local': False,
-            'timeout': self.timeout,
-            'ssh_user': '',
-            'transport': '',
-        }
-
         _config = {}
 
-        _compare_opts = [_report_opts]
+        _compare_opts = [REPORT_OPTS]
         if cmd == 'collect':
             if 'timeout' not in _config:
                 _config['timeout'] = self.timeout
-            _compare_opts.append(_collect_opts)
+            _compare_opts.append(COLLECT_OPTS)
 
         for _cmd in _compare_opts:
-            for opt in _cmd:
-                if opt in _cmd_config:
-                    if not isinstance(_cmd_config[opt], type(_cmd[opt])):
-                        raise Exception(
-                            f"'{opt}' must be given as {_cmd[opt].__class__}"
-                        )
-                    _config[opt] = _cmd_config.pop(opt)
+            for opt, _type in _cmd.items():
+                if opt not in _cmd_config:
+                    continue
+                _val = _cmd_config.pop(opt)
+                if not isinstance(_val, _type):
+                    raise Exception(f"'{opt}' must be given as {_type}")
+                _config[opt] = _val
 
         # check to see if there are any lingering options specified
         if _cmd_config:
@@ -8,13 +8,14 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
-import datetime as dt
-import glob
 import os
+import selectors
 import shlex
+import signal
+import socket
 import subprocess
+import time
 
-from pipes import quote
 from rigging.actions import BaseAction
 
 TCPDUMP_BIN = '/usr/sbin/tcpdump'
@@ -73,8 +74,8 @@ class TcpdumpAction(BaseAction):
 
         self.interface = interface
 
-        _date = dt.datetime.today().strftime("%d-%m-%Y-%H:%M:%S")
-        hostname = self.exec_cmd('hostname')['stdout'].strip()
+        _date = time.strftime("%d-%m-%Y-%H:%M:%S")
+        hostname = socket.gethostname()
         name = f"{hostname}-{_date}-{self.interface}"
 
         self.tcpdump_cmd = (
@@ -84,11 +85,25 @@ class TcpdumpAction(BaseAction):
         )
 
         if expression:
-            self.tcpdump_cmd += f" {quote(expression)}"
+            self.tcpdump_cmd += f" {shlex.quote(expression)}"
 
         if self._validate_tcpdump_cmd():
             self.outfn = f"{self.tmpdir}/{name}.pcap"
             self.tcpdump_cmd += f" -w {self.outfn}"
+            # with -W, tcpdump suffixes each file with its number, zero padded
+            # to the width of the largest number. If only one file is kept, no
+            # suffix is used.
+            _width = len(str(self.capture_count - 1))
+            if self.capture_count > 1:
+                self.capture_files = [
+                    f"{self.outfn}{x:0{_width}d}"
+                    for x in range(self.capture_count)
+                ]
+            else:
+                self.capture_files = [self.outfn]
+            self._produces = [
+                os.path.basename(f) for f in self.capture_files
+            ]
 
     def _validate_tcpdump_cmd(self):
         """
@@ -97,27 +112,40 @@ class TcpdumpAction(BaseAction):
 
         :return: True if successful, else raise Exception
         """
-        proc, devnull = self.start_tcpdump()
+        proc = self.start_tcpdump()
+        _sel = selectors.DefaultSelector()
+        _sel.register(proc.stderr, selectors.EVENT_READ)
         try:
-            # if we hit an error in the first second of execution, it means
-            # tcpdump was configured incorrectly
-            stdout, stderr = proc.communicate(timeout=1)
-            if stderr:
+            # if tcpdump exits with an error in the first second of execution,
+            # it was configured incorrectly. Once it reports that it is
+            # listening, the command is known good and we can stop waiting.
+            stderr = b''
+            exited = False
+            _end = time.monotonic() + 1
+            while _end > time.monotonic():
+                if not _sel.select(_end - time.monotonic()):
+                    break
+                _data = os.read(proc.stderr.fileno(), 4096)
+                if not _data:
+                    exited = True
+                    break
+                stderr += _data
+                if b'listening on' in stderr:
+                    break
+            if exited and stderr:
                 raise Exception(
                     stderr.decode('utf-8', 'ignore').strip()
                 )
             self.logger.debug(
                 "tcpdump command validated with no errors returned"
             )
-        except subprocess.TimeoutExpired:
-            pass
         except Exception as err:
             raise Exception(
                 f"Error during validation of tcpdump command: {err}"
             )
         finally:
-            proc.terminate()
-            devnull.close()
+            _sel.close()
+            self.stop_tcpdump(proc)
 
         return True
 
@@ -127,11 +155,21 @@ class TcpdumpAction(BaseAction):
         we have meaningful data throughout the life of the rig.
         """
         try:
-            self.proc, self.devnull = self.start_tcpdump()
+            self.proc = self.start_tcpdump()
         except Exception as err:
             raise Exception(
                 f"Error while starting background packet capture: {err}"
             )
+        # the command was validated during configure, so only briefly check
+        # that the capture did not immediately exit
+        try:
+            self.proc.wait(timeout=0.25)
+        except subprocess.TimeoutExpired:
+            return
+        _err = self.proc.stderr.read().decode('utf-8', 'ignore').strip()
+        raise Exception(
+            f"Background packet capture exited unexpectedly: {_err}"
+        )
 
     def start_tcpdump(self):
         """
@@ -139,31 +177,52 @@ class TcpdumpAction(BaseAction):
         """
 
         self.logger.debug(f"Running tcpdump as '{self.tcpdump_cmd}'")
-        devnull = open(os.devnull, 'w')
         proc = subprocess.Popen(shlex.split(self.tcpdump_cmd), shell=False,
-                                stdout=devnull, stderr=subprocess.PIPE)
-        return proc, devnull
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE,
+                                start_new_session=True)
+        return proc
+
+    def stop_tcpdump(self, proc):
+        """
+        Stop a running tcpdump command and wait for it to exit. SIGINT is used
+        so that tcpdump flushes and closes its current savefile cleanly, and
+        is sent to tcpdump's entire process group.
+        """
+        if proc.poll() is None:
+            try:
+                # tcpdump is started in its own session, so its process group
+                # id is its pid
+                os.killpg(proc.pid, signal.SIGINT)
+            except ProcessLookupError:
+                # exited since it was polled, it only needs reaping below
+                pass
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self.logger.debug('tcpdump did not exit after SIGINT, killing')
+                proc.kill()
+                proc.wait()
+        proc.stderr.close()
 
     def trigger(self):
         self.logger.debug("Stopping tcpdump")
         try:
-            self.proc.terminate()
-            _files = glob.glob(self.outfn + '*')
-            for _file in _files:
-                self.add_archive_file(_file)
-            self.devnull.close()
+            self.stop_tcpdump(self.proc)
         except Exception as err:
             self.logger.error(f"Could not stop tcpdump: {err}")
+        # whatever was captured is still collected if stopping failed
+        for _file in self.capture_files:
+            if os.path.isfile(_file):
+                self.add_archive_file(_file)
         return True
 
     def cleanup(self):
         try:
-            self.proc.terminate()
-            self.devnull.close()
+            self.stop_tcpdump(self.proc)
         except Exception as err:
             self.logger.error(f"Error during tcpdump cleanup: {err}")
 
     @property
     def produces(self):
-        basename = self.outfn.split('/')[-1]
-        return [f"{basename}{x}" for x in range(self.capture_count)]
+        return self._produces
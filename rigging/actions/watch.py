@@ -8,15 +8,114 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from rigging.actions import BaseAction, check_exists
 from subprocess import Popen, PIPE, STDOUT
-from threading import Thread
+from threading import Event, Thread
 
+import functools
+import selectors
 import shlex
+import shutil
+import socket
+import struct
 import time
 import os
 
+# the files and commands watched by the standard set, sourced from monitor.sh
+STANDARD_FILES = (
+    ('/proc/interrupts', 'interrupts'),
+    ('/proc/vmstat', 'vmstat'),
+    ('/proc/net/softnet_stat', 'softnet_stat'),
+    ('/proc/softirqs', 'softirqs'),
+    ('/proc/net/sockstat', 'sockstat'),
+    ('/proc/net/sockstat6', 'sockstat6'),
+    ('/proc/net/dev', 'netdev'),
+    ('/proc/net/sctp/assocs', 'sctp_assocs'),
+    ('/proc/net/sctp/snmp', 'sctp_snmp'),
+)
+# each command is paired with its binary, for checking that it exists
+STANDARD_CMDS = tuple(
+    (cmd.split()[0], cmd) for cmd in (
+        'netstat -s', 'nstat -az', 'ss -noemitaup', 'ps -alfe',
+        'top -c -b -n 1', 'numastat', 'ip neigh show', 'tc -s qdisc'
+    )
+)
+
+# rtnetlink values used to dump qdiscs, from linux/netlink.h, linux/rtnetlink.h
+# and linux/pkt_sched.h
+NLMSG_HDR = '=LHHLL'
+NLMSG_HDRLEN = struct.calcsize(NLMSG_HDR)
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+RTM_NEWQDISC = 36
+RTM_GETQDISC = 38
+TCMSG = '=BBHiIII'
+TCMSG_LEN = struct.calcsize(TCMSG)
+TCA_KIND = 1
+
+
+@functools.lru_cache(maxsize=None)
+def devnull_fd():
+    """
+    Open /dev/null once, to be shared as stdin by every command collector.
+    """
+    return os.open(os.devnull, os.O_RDONLY)
+
+
+def _nl_align(length):
+    return (length + 3) & ~3
+
+
+def get_mq_devices():
+    """
+    Determine which network devices are using the mq qdisc, by dumping the
+    qdiscs directly over rtnetlink instead of running and parsing the output
+    of `tc qdisc show`.
+
+    :returns:   The names of devices with an mq qdisc
+    :rtype:     ``list``
+    """
+    devs = []
+    with socket.socket(socket.AF_NETLINK, socket.SOCK_RAW,
+                       socket.NETLINK_ROUTE) as sock:
+        sock.bind((0, 0))
+        tcmsg = struct.pack(TCMSG, socket.AF_UNSPEC, 0, 0, 0, 0, 0, 0)
+        sock.send(struct.pack(NLMSG_HDR, NLMSG_HDRLEN + TCMSG_LEN,
+                              RTM_GETQDISC, NLM_F_REQUEST | NLM_F_DUMP, 1, 0)
+                  + tcmsg)
+        while True:
+            data = sock.recv(65536)
+            offset = 0
+            while offset + NLMSG_HDRLEN <= len(data):
+                _len, _type = struct.unpack_from(NLMSG_HDR, data, offset)[:2]
+                if _type == NLMSG_DONE or _len < NLMSG_HDRLEN:
+                    return devs
+                if _type == NLMSG_ERROR:
+                    _err = -struct.unpack_from('=i', data,
+                                               offset + NLMSG_HDRLEN)[0]
+                    raise OSError(_err, os.strerror(_err))
+                if _type == RTM_NEWQDISC:
+                    _ifindex = struct.unpack_from(
+                        TCMSG, data, offset + NLMSG_HDRLEN
+                    )[3]
+                    _attr = offset + NLMSG_HDRLEN + TCMSG_LEN
+                    while _attr + 4 <= offset + _len:
+                        _alen, _atype = struct.unpack_from('=HH', data, _attr)
+                        if _alen < 4:
+                            break
+                        if _atype == TCA_KIND:
+                            _kind = data[_attr + 4:_attr + _alen]
+                            if _kind.rstrip(b'\0') == b'mq':
+                                _dev = socket.if_indextoname(_ifindex)
+                                if _dev not in devs:
+                                    devs.append(_dev)
+                            break
+                        _attr += _nl_align(_alen)
+                offset += _nl_align(_len)
+
 
 class BackgroundCollector(Thread):
     """Used by this action to run a thread in the background that will
@@ -25,61 +124,113 @@ class BackgroundCollector(Thread):
 
     def __init__(self, interval):
         self.interval = interval
-        self._running = False
-        self.stopped = False
+        self._stop_event = Event()
         super(BackgroundCollector, self).__init__(daemon=True)
 
-    def start(self):
-        self._running = True
-        super(BackgroundCollector, self).start()
-
     def stop(self):
-        self._running = False
+        self._stop_event.set()
 
     def _continue(self):
         """Block for up to rig-configured-interval seconds, before returning
         True to allow the run() loop to continue on to the next iteration.
-        If during this time self._running is set to False
-        (e.g. via self.stop()), immediately return False to break out of the
-        run loop without having to wait for the entire interval to pass
+        If during this time stop() is called, immediately return False to
+        break out of the run loop without having to wait for the entire
+        interval to pass.
 
-        We need to use this approach instead of a threading.Event() pill
-        because we double fork the rig's main process in order to run in the
-        background.
+        The rig's main process is double forked before any collectors are
+        started, so it is safe to use an Event here.
 
         :returns:   True if run() should continue executing, else false
         :rtype:     ``bool``
         """
-        _max = datetime.now() + timedelta(seconds=self.interval)
-        while datetime.now() < _max:
-            if not self._running:
-                return False
-            time.sleep(1)
-        return True
+        return not self._stop_event.wait(self.interval)
 
     def run(self):
-        # get the first set of data when the rig starts, not after the first
-        # interval has passed
-        self._run_and_write()
-        while self._continue():
+        # keep the output files open for the life of the collector, rather
+        # than re-opening them for every collection. These are unbuffered so
+        # that each collection is on disk if the rig triggers.
+        self._outs = {
+            fname: self._open_output(fname) for fname in self.output_files
+        }
+        try:
+            # get the first set of data when the rig starts, not after the
+            # first interval has passed
             self._run_and_write()
+            while self._continue():
+                self._run_and_write()
+        finally:
+            for _out in self._outs.values():
+                _out.close()
 
-        self.stopped = True
+    @staticmethod
+    def _open_output(fname):
+        """
+        Open an output file for writing, positioned at its end. O_APPEND is
+        deliberately not used, as copy_file_range() refuses to write to such
+        files. Each output file is only ever written by its own collector,
+        so there are no other writers to append safely against.
+
+        :param fname:   The path of the output file
+        :returns:       An unbuffered binary file object
+        """
+        fd = os.open(fname, os.O_WRONLY | os.O_CREAT, 0o644)
+        os.lseek(fd, 0, os.SEEK_END)
+        return open(fd, 'wb', buffering=0)
 
     @staticmethod
-    def _write_with_header(fobj, content):
+    def _header():
+        _secs, _ns = divmod(time.time_ns(), 1000000000)
+        _now = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(_secs))
+        return f"==== {_now}.{_ns // 1000:06d} ====\n".encode()
+
+    @classmethod
+    def _write_with_header(cls, fobj, content, header=None):
         """
         Write our timestamped header to the output file followed by whatever
         has been collected by the background thread.
 
         :param fobj:    The open file object to write the header to
         :param content: The content to write to the file
+        :param header:  A header already generated for this collection, if
+                        any, otherwise a new one is generated
         """
         try:
-            fobj.write(f"==== {datetime.now()} ====\n")
-            fobj.write(f"{content}\n")
+            fobj.write((header or cls._header()) + f"{content}\n".encode())
         except Exception as err:
-            fobj.write(f"Rig error: Unable to write content: {err}")
+            fobj.write(f"Rig error: Unable to write content: {err}".encode())
+
+    @classmethod
+    def _copy_with_header(cls, fobj, path, header=None):
+        """
+        Write our timestamped header to the output file followed by the
+        contents of another file. The content is copied as bytes, in-kernel
+        where the source file supports it, instead of being read into a str.
+
+        :param fobj:    The open file object to write to
+        :param path:    The path of the file to copy the contents of
+        :param header:  A header already generated for this collection, if
+                        any, otherwise a new one is generated
+        """
+        src = os.open(path, os.O_RDONLY)
+        try:
+            fobj.write(header or cls._header())
+            # pseudo files, such as those under /proc, report a size of 0 and
+            # are read directly below instead
+            remaining = os.fstat(src).st_size
+            try:
+                while remaining > 0:
+                    _copied = os.copy_file_range(src, fobj.fileno(), remaining)
+                    if not _copied:
+                        break
+                    remaining -= _copied
+            except OSError:
+                # not supported between these files, read what is left
+                pass
+            while (_data := os.read(src, 65536)):
+                fobj.write(_data)
+            fobj.write(b'\n')
+        finally:
+            os.close(src)
 
     def _run_and_write(self):
         """
@@ -90,35 +241,47 @@ class BackgroundCollector(Thread):
         """
         raise NotImplementedError
 
+    @property
+    def output_files(self):
+        """
+        The file(s) this collector writes to, which should be added to the
+        rig's archive.
+        """
+        return [self.fname]
+
 
-class FileCollector(BackgroundCollector):
+class MultiFileCollector(BackgroundCollector):
     """
-    Used to collect the contents of a particular file as defined by this rig.
+    Used to collect the contents of the files watched by this rig. All files
+    are collected from a single thread, rather than a thread per file.
     """
 
-    def __init__(self, to_copy, fname, interval):
+    def __init__(self, files, interval):
         """
-        :param to_copy:     The name of the file to capture
-        :type to_copy:      ``str``
-
-        :param fname:       Path to save the file contents to, including tmpdir
-        :type fname:        ``str``
+        :param files:       Pairs of the file to capture and the path to save
+                            its contents to, including tmpdir
+        :type files:        ``list`` of ``tuple``
 
         :param interval:    Time to wait between subsequent collections
         :type interval:     ``int``
         """
-        self.to_copy = to_copy
-        self.fname = fname
-        super(FileCollector, self).__init__(interval=interval)
+        self.files = files
+        super(MultiFileCollector, self).__init__(interval=interval)
 
     def _run_and_write(self):
-        with open(self.fname, 'a') as out_file:
+        # every file copied during this collection shares the same header
+        _header = self._header()
+        for to_copy, fname in self.files:
+            out_file = self._outs[fname]
             try:
-                with open(self.to_copy, 'r') as _to_copy:
-                    self._write_with_header(out_file, _to_copy.read())
+                self._copy_with_header(out_file, to_copy, _header)
             except Exception as err:
-                msg = f"Unable to copy contents of {self.to_copy}: {err}"
-                self._write_with_header(out_file, msg)
+                msg = f"Unable to copy contents of {to_copy}: {err}"
+                self._write_with_header(out_file, msg, _header)
+
+    @property
+    def output_files(self):
+        return [f[1] for f in self.files]
 
 
 class CmdCollector(BackgroundCollector):
@@ -140,6 +303,11 @@ class CmdCollector(BackgroundCollector):
         :type interval:     ``int``
         """
         self.cmd = shlex.split(cmd)
+        # resolve the binary once up front. An absolute path, along with not
+        # requiring close_fds, lets subprocess use posix_spawn() instead of
+        # fork() + exec() for every execution
+        self.cmd[0] = shutil.which(self.cmd[0]) or self.cmd[0]
+        self._stdin = devnull_fd()
         self.fname = fname
         super(CmdCollector, self).__init__(interval=interval)
 
@@ -147,16 +315,38 @@ class CmdCollector(BackgroundCollector):
         """
         Run the monitor's command and write the output to requested file
         """
-        with open(self.fname, 'a') as ofile:
-            _proc = Popen(self.cmd, shell=False, stdout=PIPE,
-                          stderr=STDOUT, encoding='utf-8')
-            try:
-                timeout = max(1, self.interval / 2)
-                msg, serr = _proc.communicate(timeout=timeout)
-            except Exception as err:
-                _proc.terminate()
-                msg = f"Could not collect command output: {err}"
-            self._write_with_header(ofile, msg)
+        timeout = max(1, self.interval / 2)
+        try:
+            # fds opened by python are non-inheritable, so close_fds is not
+            # needed
+            _proc = Popen(self.cmd, shell=False, stdin=self._stdin,
+                          stdout=PIPE, stderr=STDOUT, close_fds=False)
+        except Exception as err:
+            self._write_with_header(
+                self._outs[self.fname],
+                f"Could not collect command output: {err}"
+            )
+            return
+        # stderr is merged into stdout and there is no stdin to feed, so read
+        # the single pipe directly until EOF or the deadline passes
+        _out = bytearray()
+        _fd = _proc.stdout.fileno()
+        _deadline = time.monotonic() + timeout
+        with _proc, selectors.DefaultSelector() as _sel:
+            _sel.register(_fd, selectors.EVENT_READ)
+            while True:
+                _remaining = _deadline - time.monotonic()
+                if _remaining <= 0 or not _sel.select(_remaining):
+                    _proc.kill()
+                    msg = (f"Could not collect command output: command timed "
+                           f"out after {timeout} seconds")
+                    break
+                _data = os.read(_fd, 65536)
+                if not _data:
+                    msg = _out.decode('utf-8', 'replace')
+                    break
+                _out += _data
+        self._write_with_header(self._outs[self.fname], msg)
 
 
 class WatchAction(BaseAction):
@@ -231,7 +421,7 @@ class WatchAction(BaseAction):
                 _cmdfn = _cmd.split()[0]
                 if not check_exists(_cmdfn) and not os.path.exists(_cmdfn):
                     raise Exception(
-                        f"Cannot watch command '{_cmd.split()[0]}': "
+                        f"Cannot watch command '{_cmdfn}': "
                         f"command not found"
                     )
                 _outfn = _cmd.replace(' ', '_').replace('/', '.').lstrip('.')
@@ -244,24 +434,19 @@ class WatchAction(BaseAction):
             self.logger.debug(
                 'Standard set requested, adding items sourced from monitor.sh'
             )
-            self.files.extend([
-                {'path': '/proc/interrupts', 'dest': 'interrupts'},
-                {'path': '/proc/vmstat', 'dest': 'vmstat'},
-                {'path': '/proc/net/softnet_stat', 'dest': 'softnet_stat'},
-                {'path': '/proc/softirqs', 'dest': 'softirqs'},
-                {'path': '/proc/net/sockstat', 'dest': 'sockstat'},
-                {'path': '/proc/net/sockstat6', 'dest': 'sockstat6'},
-                {'path': '/proc/net/dev', 'dest': 'netdev'},
-                {'path': '/proc/net/sctp/assocs', 'dest': 'sctp_assocs'},
-                {'path': '/proc/net/sctp/snmp', 'dest': 'sctp_snmp'}
-            ])
-
-            for cmd in ['netstat -s', 'nstat -az', 'ss -noemitaup', 'ps -alfe',
-                        'top -c -b -n 1', 'numastat', 'ip neigh show',
-                        'tc -s qdisc']:
-                if not check_exists((cmd.split()[0])):
+            self.files.extend(
+                {'path': path, 'dest': dest} for path, dest in STANDARD_FILES
+            )
+
+            # each check walks all of PATH, so check the binaries concurrently
+            _names = {_cmdfn for _cmdfn, cmd in STANDARD_CMDS}
+            _names.add('tc')
+            with ThreadPoolExecutor(max_workers=8) as _pool:
+                _present = dict(zip(_names, _pool.map(check_exists, _names)))
+            for _cmdfn, cmd in STANDARD_CMDS:
+                if not _present[_cmdfn]:
                     self.logger.debug(
-                        f"Command '{cmd.split()[0]}' not found locally, "
+                        f"Command '{_cmdfn}' not found locally, "
                         f"skipping from standard set"
                     )
                     continue
@@ -270,16 +455,26 @@ class WatchAction(BaseAction):
                     'filename': cmd.replace(' ', '_')
                 })
 
-            mdevs = self.exec_cmd('tc qdisc show')
-            if mdevs['status'] == 0:
-                for mdevln in mdevs['stdout'].splitlines():
-                    if 'qdisc mq' in mdevln:
-                        mdev = mdevln.split('dev')[1].strip().split()[0]
-                        tccmd = f"tc -s class show dev {mdev}"
-                        self.commands.append({
-                            'command': tccmd,
-                            'filename': tccmd.replace(' ', '_')
-                        })
+            if _present['tc']:
+                try:
+                    mdevs = get_mq_devices()
+                except Exception as err:
+                    self.logger.debug(f"Unable to determine mq devices: {err}")
+                    mdevs = []
+                for mdev in mdevs:
+                    tccmd = f"tc -s class show dev {mdev}"
+                    self.commands.append({
+                        'command': tccmd,
+                        'filename': tccmd.replace(' ', '_')
+                    })
+        # drop anything watched more than once, e.g. a file that is also part
+        # of the standard set, so that it is not collected repeatedly
+        self.files = list(
+            {(f['path'], f['dest']): f for f in self.files}.values()
+        )
+        self.commands = list(
+            {c['filename']: c for c in self.commands}.values()
+        )
         if not self.files and not self.commands:
             raise Exception('No valid files or commands to watch provided')
 
@@ -287,36 +482,43 @@ class WatchAction(BaseAction):
         """
         Launch the background threads to perform monitoring
         """
-        self.procs = {}
+        self.procs = []
 
         for cmd in self.commands:
             _outfn = os.path.join(self.tmpdir, cmd['filename'])
-            self.procs[cmd['filename']] = CmdCollector(
+            _proc = CmdCollector(
                 cmd['command'], _outfn, self.config['interval']
             )
-
-        for _file in self.files:
-            _outfn = os.path.join(self.tmpdir, _file['dest'])
-            self.procs[_file['dest']] = FileCollector(
-                _file['path'], _outfn, self.config['interval']
-            )
+            _proc.name = cmd['filename']
+            self.procs.append(_proc)
+
+        _files = [
+            (_file['path'], os.path.join(self.tmpdir, _file['dest']))
+            for _file in self.files
+        ]
+        if _files:
+            _proc = MultiFileCollector(_files, self.config['interval'])
+            _proc.name = 'files'
+            self.procs.append(_proc)
 
         for proc in self.procs:
-            self.logger.debug(f"Starting '{proc}' periodic collector")
-            self.procs[proc].start()
+            self.logger.debug(f"Starting '{proc.name}' periodic collector")
+            proc.start()
         return True
 
     def trigger(self):
         # send the stop signal to all monitors
+        _files = []
         for proc in self.procs:
-            self.procs[proc].stop()
-            self.add_archive_file(self.procs[proc].fname)
-        while not all([p.stopped for p in self.procs.values()]):
-            stopped = ', '.join(
-                p for p in self.procs if not self.procs[p].stopped
-            )
-            self.logger.info(f"Waiting for collectors {stopped} to stop")
-            time.sleep(self.config['interval'])
+            proc.stop()
+            _files.extend(proc.output_files)
+        self.add_archive_file(_files)
+        # block on each collector thread exiting, rather than polling them
+        for proc in self.procs:
+            proc.join(self.config['interval'])
+            if proc.is_alive():
+                self.logger.info(f"Waiting for collector {proc.name} to stop")
+                proc.join()
 
     @property
     def produces(self):
@@ -10,10 +10,12 @@
 
 import logging
 import os
+import queue
 import sys
 import tempfile
+import weakref
 
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 class RigCmd():
@@ -80,15 +82,100 @@ class RigCmd():
         self.logger.setLevel(logging.DEBUG)
         self._main_log = '/var/log/rig/rig.log'
         self._private_log = os.path.join(self.tmpdir, f"rig_{self.name}.log")
+        _handlers = []
         for flog in [self._main_log, self._private_log]:
             _flog = RigRotatingFileHandler(flog)
             _flog.setFormatter(logging.Formatter(
                 '%(asctime)s::%(rig_id)s::%(levelname)s: %(message)s'))
-            self.logger.addHandler(_flog)
+            _handlers.append(_flog)
+        # the file handlers are written to from a background thread, so that
+        # logging calls from the rig's threads do not block on disk I/O
+        self.logger.addHandler(RigQueueHandler(_handlers))
         self.logger = logging.LoggerAdapter(self.logger,
                                             extra={'rig_id': self.name})
 
 
+class RigQueueHandler(QueueHandler):
+    """
+    Queues log records for a QueueListener, which writes them to the actual
+    log file handlers from its own thread.
+
+    The listener thread does not survive a fork, so it is stopped before and
+    restarted after any fork, which also ensures that the queue has been
+    drained. Flushing this handler waits for the queue to be drained, and
+    closing it, e.g. via logging.shutdown(), stops the listener and writes
+    any records still queued.
+    """
+
+    def __init__(self, handlers):
+        QueueHandler.__init__(self, queue.Queue())
+        self.listener = QueueListener(self.queue, *handlers)
+        self._listening = False
+        _QUEUE_HANDLERS.add(self)
+        self._start_listener()
+
+    def _start_listener(self):
+        with self.lock:
+            if not self._listening and self in _QUEUE_HANDLERS:
+                self.listener.start()
+                self._listening = True
+
+    def _stop_listener(self):
+        with self.lock:
+            if self._listening:
+                self.listener.stop()
+                self._listening = False
+
+    def flush(self):
+        """
+        Wait until every record queued so far has been written out by the
+        listener.
+        """
+        with self.lock:
+            if self._listening:
+                self.queue.join()
+
+    def close(self):
+        with self.lock:
+            _QUEUE_HANDLERS.discard(self)
+            self._stop_listener()
+            QueueHandler.close(self)
+
+
+# RigQueueHandlers with a listener that needs stopping around a fork, and
+# those that were stopped for the fork in progress
+_QUEUE_HANDLERS = weakref.WeakSet()
+_FORK_STOPPED = []
+
+
+def _stop_queue_listeners():
+    # the handler lock is held until after the fork, so that no record can be
+    # in the middle of being queued when the process is copied
+    for handler in list(_QUEUE_HANDLERS):
+        handler.acquire()
+        handler._stop_listener()
+        _FORK_STOPPED.append(handler)
+
+
+def _restart_queue_listeners():
+    while _FORK_STOPPED:
+        handler = _FORK_STOPPED.pop()
+        handler._start_listener()
+        handler.release()
+
+
+def _restart_child_queue_listeners():
+    # logging has already reset every handler lock in the child, so there is
+    # nothing to release here
+    while _FORK_STOPPED:
+        _FORK_STOPPED.pop()._start_listener()
+
+
+os.register_at_fork(before=_stop_queue_listeners,
+                    after_in_parent=_restart_queue_listeners,
+                    after_in_child=_restart_child_queue_listeners)
+
+
 class RigRotatingFileHandler(RotatingFileHandler):
     """
     The logging module does not create parent directories for specified log
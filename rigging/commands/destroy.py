@@ -9,6 +9,7 @@
 # See the LICENSE file in the source distribution for further information.
 
 
+from concurrent.futures import ThreadPoolExecutor
 from rigging.commands import RigCmd
 from rigging.connection import RigDBusConnection
 from rigging.exceptions import DBusServiceDoesntExistError
@@ -38,9 +39,14 @@ class DestroyCmd(RigCmd):
                             help='Force remove a dead rig')
 
     def execute(self):
-        for target in self.options['rig_id']:
+        targets = self.options['rig_id']
+        # each destroy waits on its own dbus round trip, so send them all at
+        # once and then report the results in the order they were requested
+        with ThreadPoolExecutor(max_workers=min(32, len(targets))) as pool:
+            futures = [pool.submit(self._run_destroy, t) for t in targets]
+        for target, future in zip(targets, futures):
             try:
-                result = self._run_destroy(target)
+                result = future.result()
                 self.ui_logger.info(f"Rig '{target}': {result}")
             except Exception as err:
                 # don't stop iteration due to one bad attempt
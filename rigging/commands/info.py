@@ -8,8 +8,6 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
-import json
-
 from rigging.commands import RigCmd
 from rigging.connection import RigDBusConnection
 from rigging.exceptions import DBusServiceDoesntExistError
@@ -27,6 +25,7 @@ class InfoCmd(RigCmd):
         parser.add_argument('rig_id', help='The ID of the rig')
 
     def execute(self):
+        import json
         try:
             conn = RigDBusConnection(self.options['rig_id'])
             _i = conn.info().result
@@ -10,8 +10,10 @@
 
 import dbus
 
+from concurrent.futures import ThreadPoolExecutor
 from rigging.commands import RigCmd
-from rigging.connection import RigDBusConnection
+from rigging.connection import RigDBusConnection, RIG_SERVICE_PREFIX
+from rigging.exceptions import DBusServiceDoesntExistError
 
 
 class ListCmd(RigCmd):
@@ -26,36 +28,66 @@ class ListCmd(RigCmd):
 
     def execute(self):
         bus = dbus.SessionBus()
-        rigs = {}
-        for service_name in bus.list_names():
-            if service_name.startswith("com.redhat.Rig."):
-                rig_id = service_name.split(".")[-1]
-                conn = RigDBusConnection(rig_id)
-                ret = conn.describe()
-                if ret.success:
-                    rigs[rig_id] = ret.result
-
-        nameln = max(max([len(rigs[r]['name']) for r in rigs], default=0), 14)
-        monln = max(
-            max([len(rigs[r]['monitors']) for r in rigs], default=0),
-            19
-        )
-        actln = max(
-            max([len(rigs[r]['actions']) for r in rigs], default=0),
-            19
-        )
-
-        self.ui_logger.info(
-            f"{'NAME':<{nameln+1}}{'STARTED':<21}{'MONITORS':<{monln+1}}"
-            f"{'ACTIONS':<{actln+1}}{'STATUS':<10}"
-        )
-
-        for rig in rigs:
-            _rig = rigs[rig]
-            self.ui_logger.info(
-                f"{_rig['name'][:nameln]:<{nameln+1}}"
-                f"{_rig['start_time'].split('.')[0].replace('T', ' '):<21}"
-                f"{_rig['monitors'][:monln]:<{monln+1}}"
-                f"{_rig['actions'][:actln]:<{actln+1}}"
-                f"{_rig['status']:<10}"
+        _prefix_len = len(RIG_SERVICE_PREFIX)
+        rig_ids = [
+            service_name[_prefix_len:] for service_name in bus.list_names()
+            if service_name.startswith(RIG_SERVICE_PREFIX)
+        ]
+        results = []
+        if rig_ids:
+            # describe every rig at once, rather than waiting on each rig's
+            # dbus round trip in turn
+            with ThreadPoolExecutor(max_workers=min(32, len(rig_ids))) as ex:
+                results = list(ex.map(self._describe, rig_ids))
+
+        # pull out each rig's fields and size each column to its longest
+        # value, with a minimum width, in a single pass
+        nameln, monln, actln = 14, 19, 19
+        fields = []
+        for ret in results:
+            if not (ret and ret.success):
+                continue
+            _rig = ret.result
+            _name = _rig['name']
+            _mons = _rig['monitors']
+            _acts = _rig['actions']
+            # start_time is an isoformat() timestamp, drop the 'T' and any
+            # fractional seconds
+            _ts = _rig['start_time']
+            fields.append((_name, f"{_ts[:10]} {_ts[11:19]}", _mons, _acts,
+                           _rig['status']))
+            nameln = max(nameln, len(_name))
+            monln = max(monln, len(_mons))
+            actln = max(actln, len(_acts))
+
+        nameln += 1
+        monln += 1
+        actln += 1
+        # build the whole table and hand it to the logger at once, rather than
+        # logging each row separately
+        rows = [
+            f"{'NAME'.ljust(nameln)}{'STARTED'.ljust(21)}"
+            f"{'MONITORS'.ljust(monln)}{'ACTIONS'.ljust(actln)}"
+            f"{'STATUS'.ljust(10)}"
+        ]
+        for _name, _started, _mons, _acts, _status in fields:
+            rows.append(
+                _name.ljust(nameln) + _started.ljust(21) +
+                _mons.ljust(monln) + _acts.ljust(actln) + _status.ljust(10)
             )
+        self.ui_logger.info('\n'.join(rows))
+
+    @staticmethod
+    def _describe(rig_id):
+        """
+        Get the description of a single rig
+
+        :param rig_id: The name of the rig to describe
+        :return: The RigDBusMessage returned by the rig, or None if the rig
+                 no longer exists
+        """
+        try:
+            return RigDBusConnection(rig_id).describe()
+        except DBusServiceDoesntExistError:
+            # the rig exited after the bus names were listed
+            return None
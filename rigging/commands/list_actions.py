@@ -7,9 +7,11 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import os
+import sys
+
 from rigging.commands import RigCmd
-from rigging.utilities import load_rig_actions
-from subprocess import Popen
+from rigging.utilities import load_rig_actions, load_rig_action
 
 
 class ListActionssCmd(RigCmd):
@@ -33,29 +35,24 @@ class ListActionssCmd(RigCmd):
                             help='Get detailed information on an action')
 
     def execute(self):
-        actions = load_rig_actions()
         if not self.options['show']:
-            self.ui_logger.info(
-                'The following actions are supported by your system:\n'
-            )
-            for act in actions:
-                self.ui_logger.info(
-                    f"\t{actions[act].action_name:<15}\t\t"
-                    f"{actions[act].description}")
-            self.ui_logger.info(
+            actions = load_rig_actions()
+            _log = self.ui_logger.info
+            _log('The following actions are supported by your system:\n')
+            for _act in actions.values():
+                _log(f"\t{_act.action_name:<15}\t\t{_act.description}")
+            _log(
                 "\nFor more detailed information, please see "
                 "'rig list-actions -s <name>'"
             )
         else:
-            try:
-                _act = actions[self.options['show']]
-            except KeyError:
+            _act = load_rig_action(self.options['show'])
+            if _act is None:
                 raise Exception(
                     f"Invalid monitor specified: {self.options['show']}"
                 )
 
-            p = Popen(
-                ['man', f'rig-actions-{_act.action_name}'],
-                shell=False
-            )
-            p.communicate()
+            # hand this process over to man entirely, rather than keeping
+            # it around just to wait on man to exit
+            sys.stdout.flush()
+            os.execvp('man', ['man', f'rig-actions-{_act.action_name}'])
@@ -7,9 +7,11 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import os
+import sys
+
 from rigging.commands import RigCmd
-from rigging.utilities import load_rig_monitors
-from subprocess import Popen
+from rigging.utilities import load_rig_monitors, load_rig_monitor
 
 
 class ListMonitorsCmd(RigCmd):
@@ -33,29 +35,24 @@ class ListMonitorsCmd(RigCmd):
                             help='Get detailed information on a monitor')
 
     def execute(self):
-        monitors = load_rig_monitors()
         if not self.options['show']:
-            self.ui_logger.info(
-                'The following rigs are supported by your system:\n'
-            )
-            for mon in monitors:
-                self.ui_logger.info(
-                    f"\t{monitors[mon].monitor_name:<15}\t\t"
-                    f"{monitors[mon].description}")
-            self.ui_logger.info(
+            monitors = load_rig_monitors()
+            _log = self.ui_logger.info
+            _log('The following rigs are supported by your system:\n')
+            for _mon in monitors.values():
+                _log(f"\t{_mon.monitor_name:<15}\t\t{_mon.description}")
+            _log(
                 "\nFor more detailed information, please see "
                 "'rig list-monitors -s <name>'"
             )
         else:
-            try:
-                _mon = monitors[self.options['show']]
-            except KeyError:
+            _mon = load_rig_monitor(self.options['show'])
+            if _mon is None:
                 raise Exception(
                     f"Invalid monitor specified: {self.options['show']}"
                 )
 
-            p = Popen(
-                ['man', f'rig-monitors-{_mon.monitor_name}'],
-                shell=False
-            )
-            p.communicate()
+            # hand this process over to man entirely, rather than keeping
+            # it around just to wait on man to exit
+            sys.stdout.flush()
+            os.execvp('man', ['man', f'rig-monitors-{_mon.monitor_name}'])
@@ -8,6 +8,7 @@
 #
 # See the LICENSE file in the source distribution for further information
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from rigging.commands import RigCmd
 from rigging.connection import RigDBusConnection
 
@@ -20,8 +21,8 @@ class TriggerCmd(RigCmd):
     This will immediately cause all monitors to stop, and all defined actions
     to be taken as if the rig was triggered by one of the monitors.
 
-    If multiple rigs are specified, they will be triggered one at a time, but
-    will not wait for the preceding rig to finish triggering its actions.
+    If multiple rigs are specified, they will all be triggered at once, and
+    will not wait for any other rig to finish triggering its actions.
     """
 
     parser_description = 'Manually trigger a rig right now'
@@ -32,10 +33,24 @@ class TriggerCmd(RigCmd):
                             help='The ID or name of the rig(s) to trigger')
 
     def execute(self):
-        for target in self.options['rig_id']:
-            try:
-                _rig = RigDBusConnection(target)
-                _rig.trigger()
-                self.ui_logger.info(f"Rig '{target}' triggered")
-            except Exception as err:
-                self.ui_logger.error(f"Failed triggering '{target}': {err}")
+        targets = self.options['rig_id']
+        # rigs do not need to be triggered in order, so send every trigger at
+        # once and report each result as it arrives
+        with ThreadPoolExecutor(max_workers=min(32, len(targets))) as pool:
+            futures = {
+                pool.submit(self._run_trigger, target): target
+                for target in targets
+            }
+            for future in as_completed(futures):
+                target = futures[future]
+                try:
+                    future.result()
+                    self.ui_logger.info(f"Rig '{target}' triggered")
+                except Exception as err:
+                    self.ui_logger.error(
+                        f"Failed triggering '{target}': {err}"
+                    )
+
+    def _run_trigger(self, target):
+        _rig = RigDBusConnection(target)
+        return _rig.trigger()
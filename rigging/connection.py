@@ -9,33 +9,39 @@
 # See the LICENSE file in the source distribution for further information.
 
 
-import ast
 import dbus
 import dbus.service
-import dbus.mainloop.glib
-from gi.repository import GLib
+import json
 from rigging.exceptions import (DBusServiceExistsError,
                                 DBusServiceDoesntExistError,
                                 DBusMethodDoesntExistError)
 
+# each rig exports its own service, named with this prefix and the rig's name
+RIG_SERVICE_PREFIX = 'com.redhat.Rig.'
+RIG_INTERFACE = 'com.redhat.RigInterface'
+
 
 class RigDBusMessage:
-    result = None
-    success = None
+    __slots__ = ('result', 'success')
 
     def __init__(self, result=None, success=None):
         self.result = result
         self.success = success
 
     def serialize(self):
+        """
+        Convert the message for sending over DBus. The result is encoded as
+        JSON, so that the receiver can restore its original type (string,
+        dict..) without evaluating it as python.
+        """
         return {
-            'result': str(self.result),
-            'success': str(self.success),
+            'result': json.dumps(self.result, default=str),
+            'success': str(bool(self.success)),
         }
 
 
 class RigDBusCommand:
-    name = None
+    __slots__ = ('name', )
 
     def __init__(self, command_name):
         self.name = command_name
@@ -55,15 +61,10 @@ class RigDBusConnection:
 
         # TODO: Check/handle errors
         self._bus = dbus.SessionBus()
-
-        try:
-            self._rig = self._bus.get_object(
-                        f"com.redhat.Rig.{rig_name}", "/RigControl")
-        except dbus.exceptions.DBusException as exc:
-            if exc.get_dbus_name() == \
-                    "org.freedesktop.DBus.Error.ServiceUnknown":
-                raise DBusServiceDoesntExistError(rig_name)
-            raise exc
+        # calls are addressed to the rig's well-known name directly. A proxy
+        # object would first resolve the name's owner, costing a round trip
+        # just to find out if the rig exists, which the call itself reports
+        self._service = f"{RIG_SERVICE_PREFIX}{rig_name}"
 
     def _communicate(self, command):
         """
@@ -73,29 +74,26 @@ class RigDBusConnection:
         :param command: The command to have the rig perform
         :return: The result of the command
         """
-        method = getattr(self._rig, command.name)
-
         try:
-            ret = method(dbus_interface="com.redhat.RigInterface")
+            ret = self._bus.call_blocking(self._service, '/RigControl',
+                                          RIG_INTERFACE, command.name, '', ())
 
-            # there is some fragility in the dbus native type subclasses it
-            # seems, so try to convert literally, otherwise take the raw value
-            # doing this ensures we return a proper message object, whose
-            # result attr matches the type of the response (string, dict..)
+            # the result is sent as JSON, see RigDBusMessage.serialize(). If
+            # it cannot be decoded, take the raw value
             try:
-                result = ast.literal_eval(ret['result'])
-            except Exception:
-                result = ret['result']
-            try:
-                success = ast.literal_eval(ret['success'])
-            except Exception:
-                success = ret['success']
+                result = json.loads(ret['result'])
+            except ValueError:
+                result = str(ret['result'])
+            success = ret['success'] == 'True'
             return RigDBusMessage(result=result, success=success)
 
         except dbus.exceptions.DBusException as exc:
             if exc.get_dbus_name() == \
                     "org.freedesktop.DBus.Error.UnknownMethod":
                 raise DBusMethodDoesntExistError(f"{command.name}()")
+            if exc.get_dbus_name() == \
+                    "org.freedesktop.DBus.Error.ServiceUnknown":
+                raise DBusServiceDoesntExistError(self.name)
             raise exc
 
         except Exception as exc:
@@ -171,14 +169,22 @@ class RigDBusListener(dbus.service.Object):
         self._command_map = {}
         self.logger = logger
 
-        dbus.mainloop.glib.DBusGMainLoop(set_as_default=True)
+        # only rigs themselves run a main loop, so CLI commands that just
+        # connect to rigs avoid loading GLib
+        from dbus.mainloop.glib import DBusGMainLoop
+        from gi.repository import GLib
+
+        DBusGMainLoop(set_as_default=True)
         self._bus = dbus.SessionBus()
-        bus_path = f"com.redhat.Rig.{rig_name}"
-        if bus_path in self._bus.list_names():
+        bus_path = f"{RIG_SERVICE_PREFIX}{rig_name}"
+        # requesting the name without queueing fails if it is already owned,
+        # so there is no need to check for an existing owner first
+        try:
+            self._bus_name = dbus.service.BusName(
+                                bus_path, self._bus, allow_replacement=False,
+                                replace_existing=False, do_not_queue=True)
+        except dbus.exceptions.NameExistsException:
             raise DBusServiceExistsError(bus_path)
-        self._bus_name = dbus.service.BusName(
-                            f"com.redhat.Rig.{rig_name}", self._bus,
-                            allow_replacement=False, replace_existing=False)
         self._loop = GLib.MainLoop()
         super().__init__(self._bus, "/RigControl")
 
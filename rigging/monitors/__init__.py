@@ -8,7 +8,9 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import logging
 import os
+import threading
 import time
 
 from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
@@ -34,7 +36,11 @@ class BaseMonitor():
         configuration from the rigfile to `configure()`.
         """
         self._monitor_threads = []
+        # each monitor thread keeps its own schedule for wait_loop()
+        self._ticks = threading.local()
         self.config = config
+        # read on every poll, so keep it as a plain attribute
+        self._interval = float(config['interval'])
         self.logger = logger
 
     def configure(self, **kwargs):
@@ -70,13 +76,23 @@ class BaseMonitor():
         which will then cause the rig to be triggered.
         """
         try:
+            if len(self._monitor_threads) == 1:
+                # nothing to wait on alongside it, so run it in this thread
+                method, args = self._monitor_threads[0]
+                return method(*args)
             futures = []
-            self.pool = ThreadPoolExecutor()
+            self.pool = ThreadPoolExecutor(
+                max_workers=len(self._monitor_threads)
+            )
             for wthread in self._monitor_threads:
                 futures.append(self.pool.submit(wthread[0], *wthread[1]))
-            results = wait(futures, return_when=FIRST_COMPLETED)
-            result = list(results[0])[0].result()
-            return result
+            done, not_done = wait(futures, return_when=FIRST_COMPLETED)
+            # the remaining watchers are no longer needed. Any that have not
+            # started yet are cancelled, and the pool is not waited on
+            for future in not_done:
+                future.cancel()
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            return next(iter(done)).result()
         except DestroyRig as err:
             self.logger.info(
                 f"Destroying rig without triggering actions due to: {err}"
@@ -89,6 +105,8 @@ class BaseMonitor():
             self.logger.error(
                 "Terminating without triggering due to previous error"
             )
+            # os._exit() skips atexit, so flush queued log records first
+            logging.shutdown()
             os._exit(1)
 
     def add_monitor_thread(self, method, args=()):
@@ -115,8 +133,19 @@ class BaseMonitor():
         """
         Helper function to ensure that if a monitor needs to pause, it is able
         to do so consistently and according to the set value of `interval`.
+
+        Waits are scheduled against the monotonic clock, so the time spent
+        working between calls does not push each subsequent check later. If
+        that work took longer than `interval`, the schedule restarts from now
+        rather than trying to catch up.
         """
-        time.sleep(self.config['interval'])
+        _now = time.monotonic()
+        _next = getattr(self._ticks, 'next', _now) + self._interval
+        if _next <= _now:
+            self._ticks.next = _now
+            return
+        self._ticks.next = _next
+        time.sleep(_next - _now)
 
     def get_info(self):
         """
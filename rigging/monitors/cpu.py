@@ -8,6 +8,7 @@
 #
 # See the LICENSE file in the source distribution for further information
 
+import operator
 import psutil
 
 from rigging.monitors import BaseMonitor
@@ -49,35 +50,39 @@ class CpuMonitor(BaseMonitor):
             'user': user
         }
 
-        if not any(m is not None for m in _metrics):
+        if not any(m is not None for m in _metrics.values()):
             raise Exception(
                 f"Must specify at least one of "
                 f"{', '.join(m for m in _metrics.keys())}"
             )
 
-        for _m in _metrics:
-            if _metrics[_m] is not None:
-                try:
-                    if float(_metrics[_m]) > 100:
-                        raise Exception(f"'{_m}' cannot exceed 100.")
-                except (TypeError, ValueError):
-                    raise Exception(
-                        f"'{_m}' must be integer or float. Not {_m.__class__}."
-                    )
+        # save this to the instance so that self.monitoring can report on it
+        self.metrics = _metrics
+
+        # only keep the metrics that were set, as floats
+        _thresholds = {}
+        for _m, _val in _metrics.items():
+            if _val is None:
+                continue
+            try:
+                _thresholds[_m] = float(_val)
+            except (TypeError, ValueError):
+                raise Exception(
+                    f"'{_m}' must be integer or float. Not {_val.__class__}."
+                )
+            if _thresholds[_m] > 100:
+                raise Exception(f"'{_m}' cannot exceed 100.")
 
-        if percent is not None:
+        _perc = _thresholds.pop('percent', None)
+        if _thresholds:
+            # overall usage is derived from the same samples as the other
+            # metrics, rather than being polled for in a separate thread
             self.add_monitor_thread(
-                self.watch_cpu_utilization,
-                (float(percent), )
+                self.watch_cpu_metrics,
+                (_thresholds, _perc)
             )
-
-        # save this to the instance so that self.monitoring can report on it
-        self.metrics = _metrics.copy()
-
-        _metrics.pop('percent')
-
-        if any(m is not None for m in _metrics.values()):
-            self.add_monitor_thread(self.watch_cpu_metrics, (_metrics, ))
+        elif _perc is not None:
+            self.add_monitor_thread(self.watch_cpu_utilization, (_perc, ))
 
     def watch_cpu_utilization(self, perc):
         """
@@ -88,14 +93,14 @@ class CpuMonitor(BaseMonitor):
         # First iteration returns meaningless data
         psutil.cpu_percent()
         while True:
-            _val = psutil.cpu_percent(interval=self.config['interval'])
+            _val = psutil.cpu_percent(interval=self._interval)
             if _val > perc:
                 self.logger.info(
                     f"CPU usage at {_val}%, exceeding threshold of {perc}%"
                 )
                 return True
 
-    def watch_cpu_metrics(self, metrics):
+    def watch_cpu_metrics(self, metrics, perc=None):
         """
         Monitor specific aspects of CPU usage, such as iowait time, as a
         percentage of overall CPU time.
@@ -103,29 +108,41 @@ class CpuMonitor(BaseMonitor):
         Note that with this method, we monitor _all_ CPU metrics in a single
         thread and with a single polling interval.
 
-        :param metrics: A dict of metrics and their respective thresholds
+        :param metrics: A dict of metrics and their respective thresholds, as
+                        floats
+        :param perc: If set, also trigger when overall CPU utilization
+                     exceeds this percentage
         """
-        _monitor = {}
-        for metric in metrics:
-            if metrics[metric] is not None:
-                _monitor[metric] = float(metrics[metric])
+        _fields = tuple(metrics)
+        _thresholds = tuple(metrics.values())
+        # pull every watched metric out of each poll in a single call
+        _getter = operator.attrgetter(*_fields)
         # first return is usually garbage data
         psutil.cpu_times_percent()
         while True:
-            _poll = psutil.cpu_times_percent(self.config['interval'])
-            for _mon in _monitor:
-                _val = float(getattr(_poll, _mon))
-                if _val >= _monitor[_mon]:
+            _poll = psutil.cpu_times_percent(self._interval)
+            if perc is not None:
+                # the same calculation that psutil.cpu_percent() uses
+                _val = round(100 - _poll.idle - _poll.iowait, 1)
+                if _val > perc:
+                    self.logger.info(
+                        f"CPU usage at {_val}%, exceeding threshold of {perc}%"
+                    )
+                    return True
+            _vals = _getter(_poll)
+            if len(_fields) == 1:
+                _vals = (_vals, )
+            for _mon, _val, _thresh in zip(_fields, _vals, _thresholds):
+                if _val >= _thresh:
                     self.logger.info(
                         f"CPU metric {_mon} is at {_val}%, exceeding threshold"
-                        f" of {_monitor[_mon]}%"
+                        f" of {_thresh}%"
                     )
                     return True
 
     @property
     def monitoring(self):
-        _info = {}
-        for metric in self.metrics:
-            if self.metrics[metric] is not None:
-                _info[metric] = f">= {self.metrics[metric]}%"
-        return _info
+        return {
+            metric: f">= {val}%" for metric, val in self.metrics.items()
+            if val is not None
+        }
@@ -64,8 +64,7 @@ class Filesystem(BaseMonitor):
         max_size = convert_to_bytes(size)
         while True:
             if self.path.is_dir():
-                cur_size = sum(f.stat().st_size for f in self.path.glob('**/*')
-                               if f.is_file())
+                cur_size = self._get_dir_size(self.path)
             else:
                 cur_size = self.path.stat().st_size
 
@@ -79,6 +78,37 @@ class Filesystem(BaseMonitor):
 
             self.wait_loop()
 
+    @staticmethod
+    def _get_dir_size(path):
+        """
+        Get the total size of all files under a directory. The file type of
+        each entry comes from the directory listing itself, so only files need
+        to be stat'd. Symlinks to files count at the size of their target, but
+        symlinked directories are not descended into, and anything that cannot
+        be read is skipped.
+
+        :param path: The directory to get the size of
+        :return: The combined size of all files, in bytes
+        """
+        total = 0
+        dirs = [path]
+        while dirs:
+            try:
+                with os.scandir(dirs.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                dirs.append(entry.path)
+                            elif entry.is_file():
+                                total += entry.stat().st_size
+                        except OSError:
+                            # removed since the directory was listed, or not
+                            # accessible to us
+                            continue
+            except OSError:
+                continue
+        return total
+
     def watch_fs_used(self, used_perc=None, used_size=None):
         """
         Watch the backing filesystem for a provided path for either
@@ -104,8 +134,9 @@ class Filesystem(BaseMonitor):
             f"be {fs_max_used}B"
         )
 
+        # the stats gathered above are still current for the first check
+        fs = fs_stat
         while True:
-            fs = os.statvfs(self.path)
             # Get current used amount in bytes
             free = fs.f_frsize * fs.f_bfree
             current_used = fs_size - free
@@ -118,6 +149,7 @@ class Filesystem(BaseMonitor):
                 )
                 return True
             self.wait_loop()
+            fs = os.statvfs(self.path)
 
     @property
     def monitoring(self):
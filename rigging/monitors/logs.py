@@ -146,7 +146,7 @@ class Logs(BaseMonitor):
         _poll.register(_journ_fd, _poll_event)
 
         while True:
-            if _poll.poll(self.config['interval']):
+            if _poll.poll(self._interval):
                 if journ.process() == journal.APPEND:
                     for entry in journ:
                         if self._match_line(entry['MESSAGE']):
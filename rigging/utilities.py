@@ -8,6 +8,7 @@
 #
 # See the LICENSE file in the source distribution for further information.
 
+import functools
 import inspect
 import os
 import psutil
@@ -78,12 +79,38 @@ def load_rig_commands():
     return rig_cmds
 
 
+def find_named_module(pkg, pkgstr, subclass, name_attr, name):
+    """
+    Find a single rig module by its name, without discovering every module
+    in the package. Modules are expected to live in a file of the same name,
+    so only that file is imported.
+
+    :param pkg: The package to search in
+    :param pkgstr: The import path of the package
+    :param subclass: The subclass that we should match found entities on
+    :param name_attr: The class attribute that holds the module's name
+    :param name: The name of the module to find
+
+    :return: The matching class, or None if it was not found
+    """
+    if not name.isidentifier() or '__' in name:
+        return None
+    for path in pkg.__path__:
+        if os.path.isfile(os.path.join(path, f"{name}.py")):
+            for _mod in import_modules(f"{pkgstr}.{name}", subclass):
+                if getattr(_mod[1], name_attr).lower() == name:
+                    return _mod[1]
+    return None
+
+
+@functools.lru_cache(maxsize=None)
 def load_rig_monitors():
     """
     Discover locally available resource monitor types.
 
     Monitors are added to a dict that is later iterated over to check if
-    the requested monitor is one that we have available to us.
+    the requested monitor is one that we have available to us. Discovery is
+    only done once, and the same dict is returned to later callers.
     """
     import rigging.monitors
     monitors = rigging.monitors
@@ -94,9 +121,11 @@ def load_rig_monitors():
     return _supported_monitors
 
 
+@functools.lru_cache(maxsize=None)
 def load_rig_actions():
     """
-    Discover locally available actions
+    Discover locally available actions. Discovery is only done once, and the
+    same dict is returned to later callers.
     """
     import rigging.actions
     actions = rigging.actions
@@ -107,6 +136,34 @@ def load_rig_actions():
     return _supported_actions
 
 
+def load_rig_monitor(name):
+    """
+    Get a single monitor type by name, importing only the module it is
+    expected to be in when possible.
+
+    :param name: The name of the monitor
+    :return: The monitor class, or None if no such monitor exists
+    """
+    import rigging.monitors
+    _mon = find_named_module(rigging.monitors, 'rigging.monitors',
+                             BaseMonitor, 'monitor_name', name)
+    return _mon or load_rig_monitors().get(name)
+
+
+def load_rig_action(name):
+    """
+    Get a single action by name, importing only the module it is expected to
+    be in when possible.
+
+    :param name: The name of the action
+    :return: The action class, or None if no such action exists
+    """
+    import rigging.actions
+    _act = find_named_module(rigging.actions, 'rigging.actions', BaseAction,
+                             'action_name', name)
+    return _act or load_rig_actions().get(name)
+
+
 def convert_to_bytes(val):
     """
     Takes a human-friendly size value and parses it into a bytes value